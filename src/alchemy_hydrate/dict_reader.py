@@ -1,14 +1,20 @@
 import csv
+import sys
 
 
 class LowerCaseDictReader(csv.DictReader):
     """A CSV DictReader that forces all header names to lowercase.
 
+    Header names are interned so row keys compare by identity with the
+    column names used by TransformData.
+
     Use it the same as any csv.DictReader.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fieldnames = (
-            [header.lower() for header in self.fieldnames] if self.fieldnames else None
+            [sys.intern(header.lower()) for header in self.fieldnames]
+            if self.fieldnames
+            else None
         )
@@ -1,6 +1,9 @@
+import dataclasses
 import datetime
 import enum
+import functools
 import inspect as pyinspect
+import keyword
 import re
 import types
 import typing
@@ -20,7 +23,8 @@ def type_is_ORM(mapper: typing.Any):
     Raises:
         TypeError when mapper isn't expected type.
     """
-    if not hasattr(mapper, "__table__") or not isinstance(mapper.__table__, sa.Table):
+    cls = mapper if isinstance(mapper, type) else type(mapper)
+    if not _is_orm_class(cls):
         name = getattr(mapper, "__name__", repr(mapper))
         tablename = getattr(mapper, "__tablename__", "?")
         raise TypeError(
@@ -29,6 +33,12 @@ def type_is_ORM(mapper: typing.Any):
         )
 
 
+@functools.cache
+def _is_orm_class(cls: type) -> bool:
+    """Does cls have a SQLAlchemy Table, checked once per class."""
+    return isinstance(getattr(cls, "__table__", None), sa.Table)
+
+
 _M = typing.TypeVar("_M", bound=typing.Any)
 
 
@@ -83,6 +93,114 @@ def _extract_unknown_relationship_expression(
     return None
 
 
+@functools.cache
+def _column_keys(table: sa.Table, ignore: tuple[str, ...]) -> frozenset[str]:
+    """Column keys of table less those ignored, walked once per table."""
+    return frozenset(c.key for c in table.columns if c.key not in ignore)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Fields:
+    """How Make populates the attributes of a mapper class."""
+
+    hints: dict[str, typing.Any]
+    relationships: frozenset[str]
+    all_keys: frozenset[str]
+    no_init: frozenset[str]
+    init_keys: frozenset[str]
+    # Sets the given init=False attributes on a new instance.
+    assign_no_init: Callable[[typing.Any, dict[str, typing.Any]], None]
+
+
+# Discovered fields by (mapper, mapper.__init__, ignore).
+_discovered: dict[tuple[type, typing.Any, tuple[str, ...]], _Fields] = {}
+
+
+def _discover_fields(mapper: type, ignore: tuple[str, ...]) -> _Fields:
+    """Classify the attributes of mapper, once per mapper class.
+
+    The result is only cached once the type hints resolve, so a mapper
+    whose forward references are defined later is discovered again.
+    Replacing mapper.__init__ also discovers again.
+    """
+    key = (mapper, mapper.__init__, ignore)
+    if (fields := _discovered.get(key)) is not None:
+        return fields
+
+    # Never call sa.inspect(mapper), so we don’t force SQLAlchemy to
+    # configure infered relationships.  Instead relationships are inferred
+    # from type hints: anything annotated but not a table column is treated
+    # as “relationship-like.”
+
+    # Type hints (safe for forward references)
+    resolved = True
+    try:
+        hints = typing.get_type_hints(mapper, include_extras=True)
+    except NameError:
+        # Fall back when forward refs or circular imports not yet resolved
+        hints = getattr(mapper, "__annotations__", {})
+        resolved = False
+
+    # Columns based purely on __table__ (no mapper inspection)
+    column_keys = _column_keys(mapper.__table__, ignore)
+
+    # Relationship-like attributes: things that are annotated but not
+    # direct table columns. This avoids hitting SQLAlchemy's
+    # mapper/relationship inspection, so we don't force configuration
+    # of unrelated mappers (which may have unresolved string refs).
+    relationships = frozenset(hints.keys()) - column_keys
+
+    # All attributes we may want to populate
+    all_keys = relationships | column_keys
+
+    # Determine which attributes are *not* passed to __init__ (init=False)
+    signature = pyinspect.signature(mapper.__init__)
+    init_param_names = {
+        p.name
+        for p in signature.parameters.values()
+        if p.name != "self"
+        and p.kind
+        in (
+            pyinspect.Parameter.POSITIONAL_OR_KEYWORD,
+            pyinspect.Parameter.KEYWORD_ONLY,
+        )
+    }
+    no_init = all_keys - init_param_names
+
+    fields = _Fields(
+        hints,
+        relationships,
+        all_keys,
+        no_init,
+        all_keys - no_init,
+        _compile_no_init_setter(no_init),
+    )
+    if resolved:
+        _discovered[key] = fields
+    return fields
+
+
+def _compile_no_init_setter(
+    names: frozenset[str],
+) -> Callable[[typing.Any, dict[str, typing.Any]], None]:
+    """Generate a function assigning the init=False attributes given.
+
+    Each attribute is assigned directly instead of a setattr() loop.
+    """
+    body = []
+    for name in sorted(names):
+        key = repr(name)
+        body.append(f"    if {key} in data:")
+        if name.isidentifier() and not keyword.iskeyword(name):
+            body.append(f"        inst.{name} = data[{key}]")
+        else:
+            body.append(f"        setattr(inst, {key}, data[{key}])")
+    src = "\n".join(["def assign_no_init(inst, data):", *body, "    return None"])
+    ns: dict[str, typing.Any] = {}
+    exec(compile(src, "<assign_no_init>", "exec"), {}, ns)
+    return ns["assign_no_init"]
+
+
 class Make(typing.Generic[_M]):
     """Make ORM instance when called or ORM dict.
 
@@ -117,6 +235,18 @@ class Make(typing.Generic[_M]):
         c = Make(Child, parent=parent())
     """
 
+    __slots__ = (
+        "mapper",
+        "hints",
+        "relationships",
+        "all_keys",
+        "no_init",
+        "_init_keys",
+        "_assign_no_init",
+        "defaults",
+        "type_defaults",
+    )
+
     def __init__(self, mapper: type[_M], *ignore: str, **defaults: typing.Any):
         """Initialize a factory for a SQLAlchemy model class.
 
@@ -131,50 +261,19 @@ class Make(typing.Generic[_M]):
         type_is_ORM(mapper)
         self.mapper: type[_M] = mapper
 
-        # Never call sa.inspect(mapper), so we don’t force SQLAlchemy to
-        # configure infered relationships.  Instead relationships are inferred
-        # from type hints: anything annotated but not a table column is treated
-        # as “relationship-like.”
-
-        # Type hints (safe for forward references)
-        try:
-            self.hints = typing.get_type_hints(self.mapper, include_extras=True)
-        except NameError:
-            # Fall back when forward refs or circular imports not yet resolved
-            self.hints = getattr(self.mapper, "__annotations__", {})
-
-        # Columns based purely on __table__ (no mapper inspection)
-        table = mapper.__table__
-        column_keys: set[str] = {c.key for c in table.columns if c.key not in ignore}
-
-        # Relationship-like attributes: things that are annotated but not
-        # direct table columns. This avoids hitting SQLAlchemy's
-        # mapper/relationship inspection, so we don't force configuration
-        # of unrelated mappers (which may have unresolved string refs).
-        annotated_keys: set[str] = set(self.hints.keys())
-        self.relationships: set[str] = annotated_keys - column_keys
-
-        # All attributes we may want to populate
-        self.all_keys: set[str] = column_keys | self.relationships
-
-        # Determine which attributes are *not* passed to __init__ (init=False)
-        signature = pyinspect.signature(mapper.__init__)
-        init_param_names = {
-            p.name
-            for p in signature.parameters.values()
-            if p.name != "self"
-            and p.kind
-            in (
-                pyinspect.Parameter.POSITIONAL_OR_KEYWORD,
-                pyinspect.Parameter.KEYWORD_ONLY,
-            )
-        }
-
-        self.no_init: set[str] = self.all_keys - init_param_names
+        fields = _discover_fields(mapper, ignore)
+        # A copy, so changing the hints of one factory leaves the others.
+        self.hints = dict(fields.hints)
+        self.relationships: frozenset[str] = fields.relationships
+        self.all_keys: frozenset[str] = fields.all_keys
+        self.no_init: frozenset[str] = fields.no_init
+        # Keys dict() may fill in, computed once instead of on every call.
+        self._init_keys: frozenset[str] = fields.init_keys
+        self._assign_no_init = fields.assign_no_init
 
         # Validate provided defaults
         self.defaults = defaults
-        invalid = set(defaults) - self.all_keys
+        invalid = defaults.keys() - self.all_keys
         if invalid:
             raise AttributeError(f"Invalid default fields: {invalid}")
 
@@ -192,10 +291,12 @@ class Make(typing.Generic[_M]):
         Returns:
             Instance of the mapper.
         """
+        # Through dict(), so changed defaults and subclass overrides apply.
         init: dict[str, typing.Any] = {}
         post: dict[str, typing.Any] = {}
+        no_init = self.no_init
         for k, v in self.dict(**kwargs).items():
-            (post if k in self.no_init else init)[k] = v
+            (post if k in no_init else init)[k] = v
 
         try:
             inst = self.mapper(**init)
@@ -208,8 +309,7 @@ class Make(typing.Generic[_M]):
 
             raise BrokenRelationshipError(self.mapper, self.factory_label, expr, exc)
 
-        for k, v in post.items():
-            setattr(inst, k, v)
+        self._assign_no_init(inst, post)
 
         return inst
 
@@ -225,11 +325,11 @@ class Make(typing.Generic[_M]):
         Returns:
             A dict suitable for Table row instance creation.
         """
-        data = self.defaults.copy()
-        data.update(kwargs)
+        # kwargs is already a new dict, only merge when there are defaults.
+        data = {**self.defaults, **kwargs} if self.defaults else kwargs
 
         # Try to infer type-based defaults for missing fields
-        for key in self.all_keys - (self.no_init | data.keys()):
+        for key in self._init_keys.difference(data):
             hint = self.hints.get(key)
             if hint is not None:
                 data[key] = self._default_for_type(hint)
@@ -14,6 +14,7 @@ Example:
     if there are commits throughout the process.
 """
 
+import functools
 import itertools
 import logging
 from collections.abc import Generator, Iterable
@@ -29,6 +30,8 @@ from malta.models.base import Base
 
 log = logging.getLogger("db.hydrate")
 
+CSV_BUFFER_SIZE = 1 << 20
+
 
 def reset_postgresql_sequence(session, table: Table):
     """Resets the sequence for a given model in PostgreSQL."""
@@ -128,24 +131,33 @@ def reset_autoincrement(session, table: Table):
         )
 
 
-def transform_csv_file(table: Table, path: Path) -> list[Any]:
+@functools.cache
+def table_transform(table: Table) -> TransformData:
+    """The TransformData for table, built once per table."""
+    return TransformData(table)
+
+
+def transform_csv_file(table: Table, path: Path) -> Generator[dict[str, Any]]:
     """Create instances from CSV.
 
+    Rows are read and converted lazily so the whole file is never held in
+    memory.
+
     Args:
         table: for mapping CSV data.
         path: of CSV file.
 
-    Returns:
-        List of model instances.
+    Yields:
+        A dict of converted values for each CSV row.
 
     Raises:
         ValueError: Converting CSV values to Model types.
     """
 
-    data = []
-    transform = TransformData(table)
+    transform = table_transform(table)
 
-    with open(path) as csv_file:
+    # The csv module wants newline="", a large buffer cuts read() calls.
+    with open(path, newline="", buffering=CSV_BUFFER_SIZE) as csv_file:
         reader = LowerCaseDictReader(csv_file)
         transform_column_names = {_.name for _ in transform}
         # CSV column headers should be in transform
@@ -156,7 +168,6 @@ def transform_csv_file(table: Table, path: Path) -> list[Any]:
         for row in reader:
             try:
                 table_data = transform(row)
-                data.append(table_data)
 
             except ValueError as ex:
                 log.error("ERROR %s %s: %s", table.name, reader.line_num, ex)
@@ -166,12 +177,16 @@ def transform_csv_file(table: Table, path: Path) -> list[Any]:
                 # this didn't work; but show all the errors without stacktrace.
                 log.exception(ex)
                 print(ex)
-
-    return data
+            else:
+                yield table_data
 
 
 def hydrate_csv_file(
-    session: Session, table: Table, path: Path, in_groups_of: int = 100
+    session: Session,
+    table: Table,
+    path: Path,
+    in_groups_of: int = 100,
+    commit_every: int = 0,
 ) -> int:
     """Hydrate the given model with the CSV.
 
@@ -179,7 +194,13 @@ def hydrate_csv_file(
         session: for database connection.
         table: for mapping CSV data.
         path: of CSV file.
-        in_groups_of: The number of models instance to commit at a time.
+        in_groups_of: The number of models instance to insert at a time.
+        commit_every: Commit after this many groups, 0 commits only once
+            the whole file is inserted.  Rows are converted as they are
+            inserted, so a ValueError on a late row comes after earlier
+            groups were executed.  With commit_every > 0 those groups
+            are already committed and the table is left half loaded;
+            with 0 nothing from this file is committed.
 
     Returns:
         The number of instances committed to the database.
@@ -195,14 +216,18 @@ def hydrate_csv_file(
     data = transform_csv_file(table, path)
 
     insert_stmt = table.insert()
-    for chunk in itertools.batched(data, in_groups_of, strict=False):
+    # Stream the rows, only one chunk is held in memory at a time.
+    chunks = itertools.batched(data, in_groups_of, strict=False)
+    for n, chunk in enumerate(chunks, 1):
         try:
             session.execute(insert_stmt, chunk)
         except Exception as ex:
             log.error(ex.with_traceback(None))
             raise SystemExit(ex)
         count += len(chunk)
-        session.commit()
+        if commit_every and n % commit_every == 0:
+            session.commit()
+    session.commit()
     log.debug("ENDED %s with %d rows", table.name, count)
     reset_autoincrement(session, table)
     return count
@@ -296,6 +321,9 @@ def get_csv_files(directory: str | Path) -> Generator[Path]:
             yield item.resolve()
 
 
+# Lookups are derived from Base and built once; the models do not change
+# while hydrating.
+@functools.cache
 def model_lookup() -> dict[str, Any]:
     return {
         getattr(v, "__tablename__", "unknown"): v
@@ -305,10 +333,16 @@ def model_lookup() -> dict[str, Any]:
     }
 
 
+@functools.cache
 def table_lookup() -> dict[str, Table]:
     return {table.name: table for table in Base.metadata.sorted_tables}
 
 
+@functools.cache
+def sorted_table_names() -> tuple[str, ...]:
+    return tuple(table.name for table in Base.metadata.sorted_tables)
+
+
 def get_table_order(only: Iterable[str] = []) -> list[str]:
     """Get the tables in the order they should by hydrated.
 
@@ -320,7 +354,11 @@ def get_table_order(only: Iterable[str] = []) -> list[str]:
     Returns:
         List of table names.
     """
-    return [t.name for t in Base.metadata.sorted_tables if not only or t.name in only]
+    names = sorted_table_names()
+    if not only:
+        return list(names)
+    only = set(only)
+    return [name for name in names if name in only]
 
 
 if __name__ == "__main__":
@@ -349,7 +387,7 @@ if __name__ == "__main__":
         example = get_table_order(args.tables)
         for name in get_table_order(args.tables):
             csv = (Path(__file__).parent.parent / f"models/csv/{name}.csv").resolve()
-            data = transform_csv_file(models[name], csv)
+            data = list(transform_csv_file(models[name], csv))
             pprint.pp(data, width=120)
     else:
         asyncio.run(hydrate_tables(args.tables, not args.clear_picked))
@@ -10,8 +10,34 @@ def _identity(x):
     return x
 
 
+_TRUE = frozenset(("true", "yes", "y", "t", "1"))
+_FALSE = frozenset(("false", "no", "n", "f", "0", ""))
+# Common spellings looked up without strip() and lower() allocating.
+_BOOLS = {
+    s: value
+    for spellings, value in ((_TRUE, True), (_FALSE, False))
+    for word in spellings
+    for s in (word, word.capitalize(), word.upper())
+}
+
+
 def _bool(x):
-    return x.lower() in ("true", "yes", "1")
+    """Parse true/yes/y/t/1 or false/no/n/f/0, in any case.
+
+    An empty string is False.
+
+    Raises:
+        ValueError for anything else.
+    """
+    value = _BOOLS.get(x)
+    if value is None:
+        folded = x.strip().lower()
+        if folded in _TRUE:
+            return True
+        if folded in _FALSE:
+            return False
+        raise ValueError(f"{x!r} is not a bool")
+    return value
 
 
 registry = {
@@ -1,16 +1,24 @@
 """Generate SQLAlchemy transform from model."""
 
 import enum
+import functools
+import warnings
+from collections import ChainMap
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Self
 
 from sqlalchemy import Column, Table
 from sqlalchemy.types import NullType
 
 from . import registry
+from .registry import _identity
 
 
-@dataclass
+_MISSING = object()
+
+
+@dataclass(slots=True, frozen=True)
 class ConvertCol:
     name: str
     nullable: bool
@@ -18,13 +26,16 @@ class ConvertCol:
     from_str: Callable[[str], Any]
 
     def __call__(self, input: str) -> Any:
-        if not input and self.nullable:
-            return None
-        return self.from_str(input)
+        # Test the value first, most cells are not empty.
+        if input or not self.nullable:
+            return self.from_str(input)
+        return None
 
 
 class TransformData:
-    def __init__(self, table: Table, extra_converters=dict[Any, Callable] | None):
+    def __init__(
+        self, table: Table, extra_converters: dict[Any, Callable] | None = None
+    ):
         """A transform for the fields in table.
 
         Args:
@@ -38,20 +49,84 @@ class TransformData:
         Raises:
             ValueError for unavailable converter for table.columns.name
         """
-        self.name: str = table.name
-        self.columns: list[ConvertCol] = []
+        self._init_columns(
+            table.name, table.columns, _merge_converters(extra_converters)
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        *columns: Column,
+        name: str = "",
+        extra_converters: dict[Any, Callable] | None = None,
+    ) -> Self:
+        """A transform for columns not attached to a Table.
+
+        Skips building a MetaData and Table for ad hoc transforms.
+
+        Args:
+            *columns: sqlalchemy Columns to convert.
+            name: Reported as the transform name.
+            extra_converters: as for TransformData.
+        """
+        transform = cls.__new__(cls)
+        transform._init_columns(name, columns, _merge_converters(extra_converters))
+        return transform
+
+    @classmethod
+    def factory(
+        cls, extra_converters: dict[Any, Callable] | None = None
+    ) -> Callable[[Table], Self]:
+        """Make TransformData for many tables sharing extra converters.
+
+        The converters are merged once instead of per table.
+
+        Args:
+            extra_converters: as for TransformData.
+
+        Returns:
+            A callable taking a table and returning its TransformData.
+        """
+        converters = _merge_converters(extra_converters)
 
-        self.converters = registry
-        if isinstance(extra_converters, dict):
-            self.converters = registry | extra_converters
+        def make(table: Table) -> Self:
+            transform = cls.__new__(cls)
+            transform._init_columns(table.name, table.columns, converters)
+            return transform
 
-        for col in table.columns:
+        return make
+
+    @classmethod
+    @functools.cache
+    def for_model(cls, model: type) -> Self:
+        """The TransformData for an ORM model class, built once per class.
+
+        Cached by class identity; mapped classes are module level
+        singletons, so they are not expected to be collected.
+
+        Args:
+            model: SQLAlchemy ORM model with a __table__.
+        """
+        return cls(model.__table__)
+
+    def _init_columns(
+        self,
+        name: str,
+        table_columns: Iterable[Column],
+        converters: Mapping[Any, Callable],
+    ):
+        """Build the column converters and compiled transform for columns."""
+        self.name: str = name
+        self.converters = converters
+        columns: list[ConvertCol] = []
+
+        for col in table_columns:
             # Convert by field name, type is irrelevant
-            if col.name in self.converters:
+            func = self.converters.get(col.name, _MISSING)
+            if func is not _MISSING:
                 python_type = None
-                func = self.converters[col.name]
             # Seen when type is subclass instance of TypeDecorators
-            elif getattr(col.type, "_is_type_decorator", None):
+            elif _is_type_decorator(type(col.type)):
                 python_type = col.type.__class__
 
                 def enum_flag_from_str(s, instance=col.type):
@@ -64,18 +139,48 @@ class TransformData:
                 python_type = self.get_column_type(col)
                 func = self.get_coverter_by_type(col, python_type)
 
-            converter = ConvertCol(col.name, bool(col.nullable), python_type, func)
-            self.columns.append(converter)
+            converter = ConvertCol(col.name, col.nullable, python_type, func)
+            columns.append(converter)
+
+        self.columns: tuple[ConvertCol, ...] = tuple(columns)
+        self._transform = _compile_transform(self.columns)
 
     def __len__(self) -> int:
         return len(self.columns)
 
     def __call__(self, input: dict[str, str]) -> dict[str, Any]:
+        return self._transform(input)
+
+    def transform_batch(self, input: dict[str, list[str]]) -> dict[str, list[Any]]:
+        """Convert column-major data, a list of values per field name.
+
+        Each column is converted in one pass with its converter, the
+        columnar counterpart of calling the transform once per row.
+
+        Args:
+            input: Field name to its values, as read from a CSV.
+
+        Returns:
+            Field name to the converted values.  Table fields not in input
+            are ignored, they may not be required.
+
+        Raises:
+            ValueError for values the converters reject.
+        """
         output = {}
-        for converter in self.columns:
-            # Ignore Table fields not in CSV, they may not be required.
-            if converter.name in input:
-                output[converter.name] = converter(input[converter.name])
+        for col in self.columns:
+            values = input.get(col.name)
+            if values is None:
+                continue
+            func = col.from_str
+            if func is _identity:
+                output[col.name] = (
+                    [s or None for s in values] if col.nullable else list(values)
+                )
+            elif col.nullable:
+                output[col.name] = [func(s) if s else None for s in values]
+            else:
+                output[col.name] = list(map(func, values))
         return output
 
     def __iter__(self):
@@ -87,56 +192,183 @@ class TransformData:
         return "\n".join(lines)
 
     def get_column_type(self, column: Column) -> Any:
-        try:
-            if isinstance(column.type, NullType) and column.foreign_keys:
-                return int
-            elif hasattr(column, "python_type"):
-                return column.python_type
-            elif hasattr(column.type, "python_type"):
-                return column.type.python_type
-            else:
-                raise TypeError(f"What underlying type is {column}")
-        except Exception:
-            raise
+        if isinstance(column.type, NullType) and column.foreign_keys:
+            return int
+        elif _has_python_type(type(column)):
+            return column.python_type
+        elif hasattr(column.type, "python_type"):
+            return column.type.python_type
+        else:
+            raise TypeError(f"What underlying type is {column}")
 
     def get_coverter_by_type(
         self, column: Column, python_type: Any
     ) -> Callable[[str], Any]:
-        if python_type in self.converters:
+        convert = self.converters.get(python_type, _MISSING)
+        if convert is not _MISSING:
             # For basic types like Mapped[str]
-            # It can be very difficult to have length violations so lets
-            # check it here.
-            if python_type is not str:
-                return self.converters[python_type]
-            else:
+            if python_type is str:
+                # It can be very difficult to have length violations so lets
+                # check it here.
                 size = getattr(column.type, "length", None)
-                if size is None:
-                    return self.converters[python_type]
-                else:
-
-                    def verify_str_length(value, max_len=size, field=column.name):
-                        if len(value) <= max_len:
-                            return value
-                        raise ValueError(f"{repr(field)} exceeds length {max_len}")
-
-                    return verify_str_length
+                if size is not None:
+                    return _str_length_validator(size, column.name, convert)
+            return convert
 
+        elif not isinstance(python_type, type):
+            raise TypeError(f"No converter for {column}")
+        # Flag is an Enum, so test it first.
         elif issubclass(python_type, enum.Flag):
+            return functools.partial(create_flag_from_string, python_type)
+        elif issubclass(python_type, enum.Enum):
+            lookup = _enum_lookup(python_type)
 
-            def enum_flag_from_str(s, t=python_type):
-                return create_flag_from_string(t, s)
-
-            return enum_flag_from_str
-        elif isinstance(python_type, enum.EnumType):
-
-            def enum_type_from_str(s: str, t=python_type):
-                return create_enum_from_string(t, s)
+            def enum_type_from_str(s: str, t=python_type, lookup=lookup):
+                member = lookup.names.get(s.upper())
+                if member is None:
+                    return _enum_by_value(t, lookup, s)
+                return member
 
             return enum_type_from_str
         else:
             raise TypeError(f"No converter for {column}")
 
 
+def _merge_converters(
+    extra_converters: dict[Any, Callable] | None,
+) -> Mapping[Any, Callable]:
+    """Layer extra converters over the shared registry instead of copying."""
+    if isinstance(extra_converters, dict):
+        return ChainMap(extra_converters, registry)
+    return registry
+
+
+@functools.cache
+def _has_python_type(column_cls: type) -> bool:
+    """Does a column class define python_type, probed once per class.
+
+    Probing a Column instance raises and catches AttributeError inside
+    its comparator __getattr__, which is costly to repeat per column.
+    """
+    return hasattr(column_cls, "python_type")
+
+
+@functools.cache
+def _is_type_decorator(type_cls: type) -> bool:
+    """Is a column type class a TypeDecorator, probed once per class."""
+    return bool(getattr(type_cls, "_is_type_decorator", False))
+
+
+def _str_length_validator(
+    size: int, field: str, convert: Callable[[str], Any] = _identity
+) -> Callable[[str], Any]:
+    """A str converter rejecting values longer than size.
+
+    The length is checked on the converted value, the one that is stored.
+    Without a converter the check is shared by every column with the same
+    name and length.  User converters need not be hashable, so those are
+    wrapped per column.  The error message is only formatted when the
+    check fails.
+    """
+    if convert is _identity:
+        return _str_length_check(size, field)
+
+    def verify_str_length(value, max_len=size, field=field, convert=convert):
+        value = convert(value)
+        if len(value) <= max_len:
+            return value
+        raise ValueError(f"{repr(field)} exceeds length {max_len}")
+
+    return verify_str_length
+
+
+@functools.cache
+def _str_length_check(size: int, field: str) -> Callable[[str], str]:
+    """A str passthrough rejecting values longer than size."""
+
+    def verify_str_length(value, max_len=size, field=field):
+        if len(value) <= max_len:
+            return value
+        raise ValueError(f"{repr(field)} exceeds length {max_len}")
+
+    return verify_str_length
+
+
+# Compiled transform builders keyed by the column layout, a tuple of
+# (name, nullable, passthrough) triples.  Tables sharing a layout share the
+# generated code; only the converters bound into the closure differ.
+_transform_builders: dict[tuple[tuple[str, bool, bool], ...], Callable] = {}
+
+
+def _compile_transform(
+    columns: Sequence[ConvertCol],
+) -> Callable[[dict[str, str]], dict[str, Any]]:
+    """Generate a function converting a CSV row for the given columns.
+
+    The per-column loop is unrolled and each converter is bound as a closure
+    variable, the way dataclasses builds `__init__` with a single `exec`.
+    Table fields not in the row are ignored, they may not be required.
+
+    Args:
+        columns: to convert, in output order.
+
+    Returns:
+        A function taking a row dict and returning the converted dict.
+    """
+    layout = tuple(
+        (col.name, col.nullable, col.from_str is _identity) for col in columns
+    )
+    builder = _transform_builders.get(layout)
+    if builder is None:
+        builder = _transform_builders[layout] = _build_transform(layout)
+    return builder(*(col.from_str for col in columns))
+
+
+def _convert_expr(i: int, nullable: bool, passthrough: bool, value: str) -> str:
+    """Source converting value for column i of a layout.
+
+    Plain str columns skip the converter call and use the value itself.
+    """
+    if passthrough:
+        return f"{value} or None" if nullable else value
+    if nullable:
+        return f"_c{i}(v) if (v := {value}) else None"
+    return f"_c{i}({value})"
+
+
+def _build_transform(layout: tuple[tuple[str, bool, bool], ...]) -> Callable:
+    """Compile the closure factory for a column layout.
+
+    A row holding every column is built with a single dict display in
+    column order.  Otherwise fall back to testing each column in turn.
+    """
+    params = ", ".join(f"_c{i}" for i in range(len(layout)))
+    items = []
+    body = []
+    for i, (name, nullable, passthrough) in enumerate(layout):
+        key = repr(name)
+        expr = _convert_expr(i, nullable, passthrough, f"row[{key}]")
+        items.append(f"{key}: {expr}")
+        body.append(f"        if {key} in row:")
+        body.append(f"            out[{key}] = {expr}")
+    src = "\n".join(
+        [
+            f"def __create_fn__({params}):",
+            "    def transform(row):",
+            "        if row.keys() >= _names:",
+            f"            return {{{', '.join(items)}}}",
+            "        out = {}",
+            *body,
+            "        return out",
+            "    return transform",
+        ]
+    )
+    ns: dict[str, Any] = {}
+    names = frozenset(name for name, *_ in layout)
+    exec(compile(src, "<transform>", "exec"), {"_names": names}, ns)
+    return ns["__create_fn__"]
+
+
 def create_enum_from_string(enum_cls, value_str):
     """
     Creates an enum member from a string value.
@@ -151,38 +383,105 @@ def create_enum_from_string(enum_cls, value_str):
     Returns:
         An instance of the enum member.
     """
-    try:
-        # Try to get the enum member directly by name (case-insensitive)
-        return enum_cls[value_str.upper()]
-    except KeyError:
-        # If not found by name, try to match by value (converting if necessary)
-        for member in enum_cls:
-            if isinstance(member.value, (int, float)):
-                try:
-                    if int(value_str) == member.value:
-                        return member
-                except ValueError:
-                    pass  # Ignore if the string cannot be converted to an integer
-            elif isinstance(member.value, str):
-                if value_str.lower() == member.value.lower():
-                    return member
-            elif isinstance(member.value, tuple):
-                # Handle Flag enums with tuple values (less common for direct string input)
-                if value_str in member.value:
-                    return member
-            else:
-                if value_str == str(member.value):
-                    return member
+    # Try the enum member by name (case-insensitive), then by value.
+    lookup = _enum_lookup(enum_cls)
+    member = lookup.names.get(value_str.upper())
+    if member is None:
+        return _enum_by_value(enum_cls, lookup, value_str)
+    return member
+
+
+@dataclass(slots=True, frozen=True)
+class _EnumLookup:
+    """Lookup tables matching create_enum_from_string for an Enum class."""
+
+    names: dict[str, enum.Enum]
+    # Members by int or lower case str value
+    values: dict[str, enum.Enum]
+    # Members by numeric value, when every member value is numeric
+    numbers: dict[int | float, enum.Enum]
+    # Must unmatched values still go through the member scan?
+    scan: bool
+
+
+@functools.cache
+def _enum_lookup(enum_cls: type[enum.Enum]) -> _EnumLookup:
+    """Classify the enum_cls member values once and build its lookup tables.
+
+    Enums whose values are all numeric or all str are fully covered by the
+    tables.  Mixed or other value types only use the names table, their
+    values go through the member scan to keep its first-match order.
+    """
+    names = dict(enum_cls.__members__)
+    values: dict[str, enum.Enum] = {}
+    numbers: dict[int | float, enum.Enum] = {}
+    kinds = set()
+    for member in enum_cls:
+        value = member.value
+        if isinstance(value, str):
+            kinds.add(str)
+            values.setdefault(value.lower(), member)
+        elif isinstance(value, (int, float)):
+            kinds.add(int)
+            numbers.setdefault(value, member)
+            if type(value) is int:
+                values.setdefault(str(value), member)
+        else:
+            kinds.add(object)
+    if kinds != {int}:
+        numbers = {}
+    return _EnumLookup(names, values, numbers, scan=len(kinds) > 1 or object in kinds)
+
+
+def _enum_by_value(enum_cls, lookup: _EnumLookup, value_str: str):
+    """The enum_cls member whose value matches value_str.
+
+    Enums with a single kind of member value use the lookup tables.  Mixed
+    or other value kinds scan the members, so the first matching member in
+    definition order wins.
+
+    Raises:
+        ValueError if no match is found.
+    """
+    if not lookup.scan:
+        member = lookup.values.get(value_str.lower())
+        if member is None and lookup.numbers:
+            try:
+                member = lookup.numbers.get(int(value_str))
+            except ValueError:
+                pass  # Ignore if the string cannot be converted to an integer
+        if member is not None:
+            return member
         raise ValueError(f"No conversion from {repr(value_str)} to {enum_cls}")
 
+    # Not found, try to match by value (converting if necessary)
+    for member in enum_cls:
+        if isinstance(member.value, (int, float)):
+            try:
+                if int(value_str) == member.value:
+                    return member
+            except ValueError:
+                pass  # Ignore if the string cannot be converted to an integer
+        elif isinstance(member.value, str):
+            if value_str.lower() == member.value.lower():
+                return member
+        elif isinstance(member.value, tuple):
+            # Handle Flag enums with tuple values (less common for direct string input)
+            if value_str in member.value:
+                return member
+        else:
+            if value_str == str(member.value):
+                return member
+    raise ValueError(f"No conversion from {repr(value_str)} to {enum_cls}")
+
 
 def create_flag_from_string(flag_cls, value: str):
     """Creates a Flag enum member from a string value.
 
     Args:
         flag_cls: enum.FlagEnum
-        value: Can be pipe-separated names or an integer.
-            'READ|WRITE' or '3'
+        value: Can be pipe or comma separated names or an integer.
+            'READ|WRITE', 'read, write' or '3'
 
     Raises:
         ValueError if no match is found.
@@ -190,29 +489,43 @@ def create_flag_from_string(flag_cls, value: str):
     Returns:
         An instance of the enum member.
     """
-    try:
-        # Try converting to integer directly
-        int_value = int(value)
-        return flag_cls(int_value)
-    except ValueError:
-        # Try matching by comma-separated names (case-insensitive)
-        flags = 0
-        for name in value.upper().replace(" ", "").split("|"):
-            try:
-                flags |= flag_cls[name].value
-            except KeyError:
-                print(f"Warning: Flag '{name}' not found in {flag_cls.__name__}")
-        return flag_cls(flags) if flags else None
-    except Exception as e:
-        print(f"Error creating Flag from '{value}': {e}")
-        return None
+    names = _flag_lookup_table(flag_cls)
+    # Try converting to integer directly, without raising for names
+    number = value.strip()
+    if number.lstrip("+-").isdecimal():
+        try:
+            return flag_cls(int(number))
+        except ValueError:
+            pass
+    # Try matching by pipe or comma separated names (case-insensitive)
+    flags = 0
+    for name in value.upper().replace(" ", "").replace(",", "|").split("|"):
+        bits = names.get(name)
+        if bits is None:
+            _warn_unknown_flag(flag_cls, name)
+        else:
+            flags |= bits
+    return flag_cls(flags) if flags else None
+
+
+@functools.cache
+def _warn_unknown_flag(flag_cls: type[enum.Flag], name: str) -> None:
+    """Warn about an unknown flag name, once per Flag class and name.
+
+    The cache is process wide and keyed on the raw CSV tokens, so it grows
+    with every distinct unknown name for the life of the process.
+    """
+    warnings.warn(f"Flag {name!r} not found in {flag_cls.__name__}", stacklevel=3)
+
+
+@functools.cache
+def _flag_lookup_table(flag_cls: type[enum.Flag]) -> dict[str, int]:
+    """Flag member values by name, built once per Flag class."""
+    return {name: member.value for name, member in flag_cls.__members__.items()}
 
 
 def is_int_enum(enum_cls):
     """Programmatically determines if an Enum (or its subclasses)  uses integers as values."""
-    if not issubclass(enum_cls, enum.Enum):
-        return False
-    for member in enum_cls:
-        if not isinstance(member.value, int):
-            return False
-    return True
+    return issubclass(enum_cls, enum.Enum) and all(
+        isinstance(member.value, int) for member in enum_cls.__members__.values()
+    )
@@ -91,16 +91,37 @@ class Defaultable(Base):
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def session():
+@pytest.fixture(scope="module")
+def engine():
     engine = sa.create_engine("sqlite:///:memory:")
+
+    # pysqlite SAVEPOINT workaround from the SQLAlchemy docs, so a commit
+    # inside a test releases its savepoint instead of the outer transaction.
+    @sa.event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @sa.event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    Session = orm.sessionmaker(bind=engine)
-    with Session() as s:
-        yield s
+    yield engine
     engine.dispose()
 
 
+@pytest.fixture
+def session(engine):
+    """Session joined to an outer transaction, rolled back after each test."""
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        with orm.Session(
+            bind=connection, join_transaction_mode="create_savepoint"
+        ) as s:
+            yield s
+        transaction.rollback()
+
+
 # ---------------------------------------------------------------------------
 # Core behavior
 # ---------------------------------------------------------------------------
@@ -129,6 +150,17 @@ def test_make_repr_class_name():
     assert "Make2(Parent)" in r
 
 
+def test_make_reuses_discovered_fields():
+    """Factories for one model share field discovery but not hints."""
+    first = Make(Parent)
+    second = Make(Parent, name="alpha")
+    assert first.all_keys is second.all_keys
+    assert first.no_init is second.no_init
+
+    first.hints["children"] = "Mapped[list[Child]]"
+    assert second.hints["children"] != "Mapped[list[Child]]"
+
+
 def test_make_creates_instance_with_inferred_defaults():
     """Required fields get reasonable inferred defaults."""
     make = Make(Defaultable)
@@ -191,6 +223,32 @@ def test_make_ignores_init_false_fields(monkeypatch):
     assert p.id == 99
 
 
+def test_make_init_false_defaults():
+    """init=False defaults are set after construction, kwargs still win."""
+    make_parent = Make(Parent, id=7, name="X")
+    assert make_parent().id == 7
+    assert make_parent(id=8).id == 8
+    assert make_parent().name == "X"
+
+
+def test_make_call_agrees_with_dict():
+    """Calling builds from dict(), so changed defaults and overrides apply."""
+    make_parent = Make(Parent, name="A")
+    make_parent.defaults["name"] = "B"
+    assert make_parent.dict()["name"] == "B"
+    assert make_parent().name == "B"
+
+    class FancyMake(Make):
+        def dict(self, **kwargs):
+            data = super().dict(**kwargs)
+            data["name"] = data["name"].upper()
+            return data
+
+    make_fancy = FancyMake(Parent)
+    assert make_fancy.dict(name="x")["name"] == "X"
+    assert make_fancy(name="x").name == "X"
+
+
 # ---------------------------------------------------------------------------
 # Enum and optional behavior
 # ---------------------------------------------------------------------------
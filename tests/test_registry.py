@@ -18,13 +18,24 @@ def test_common_int():
         (True, "true"),
         (True, "Yes"),
         (True, "1"),
+        (True, " y "),
+        (True, "T"),
         (False, "false"),
+        (False, "No"),
+        (False, "0"),
+        (False, ""),
     ),
 )
 def test_common_bool(expected, value):
     assert expected == registry[bool](value)  # noqa F712
 
 
+@pytest.mark.parametrize("value", ("maybe", "2", "truthy"))
+def test_common_bool_invalid(value):
+    with pytest.raises(ValueError):
+        registry[bool](value)
+
+
 def test_common_uuid():
     assert uuid.UUID(int=0) == registry[uuid.UUID](
         "00000000-0000-0000-0000-000000000000"
@@ -1,3 +1,4 @@
+import dataclasses
 import datetime
 import enum
 import uuid
@@ -11,6 +12,7 @@ from sqlalchemy.types import NULLTYPE
 
 from alchemy_hydrate import TransformData
 from alchemy_hydrate.transform import (
+    _warn_unknown_flag,
     create_enum_from_string,
     create_flag_from_string,
     is_int_enum,
@@ -97,6 +99,13 @@ def test_multi_type_convert():
     }
 
 
+def test_for_model_is_cached():
+    transform = TransformData.for_model(MultiTypeModel)
+    assert transform is TransformData.for_model(MultiTypeModel)
+    assert "multi_type" == transform.name
+    assert 7 == len(transform)
+
+
 def transformer(*args):
     return TransformData(Table("demo", MetaData(), *args))
 
@@ -125,6 +134,137 @@ def test_str_empty():
     assert {"nullable_false": "", "nullable_true": None} == data
 
 
+def test_transform_batch():
+    """Column-major data converts the same as row by row."""
+    convert = transformer(
+        Column("id", Integer, nullable=False),
+        Column("count", Integer, nullable=True),
+        Column("note", String, nullable=True),
+        Column("msg", String(5), nullable=False),
+    )
+
+    assert {
+        "id": [1, 2],
+        "count": [None, 3],
+        "note": ["a", None],
+        "msg": ["hi", ""],
+    } == convert.transform_batch(
+        {
+            "id": ["1", "2"],
+            "count": ["", "3"],
+            "note": ["a", ""],
+            "msg": ["hi", ""],
+            "other": ["x", "y"],
+        }
+    )
+    with pytest.raises(ValueError):
+        convert.transform_batch({"msg": ["too long"]})
+
+
+def test_missing_fields_ignored():
+    """Table fields not in the input are left out of the output."""
+    convert = transformer(
+        Column("id", Integer, nullable=False),
+        Column("note", String(10), nullable=True),
+    )
+
+    assert {"id": 1} == convert({"id": "1"})
+    assert {"note": None} == convert({"note": ""})
+    assert {} == convert({"other": "x"})
+
+
+def test_awkward_column_names():
+    """Column names are not required to be identifiers."""
+    convert = transformer(
+        Column("two words", Integer),
+        Column("it's", String),
+    )
+
+    assert {"two words": 2, "it's": "yes"} == convert({"two words": "2", "it's": "yes"})
+
+
+def test_extra_converters():
+    """Extra converters match by field name or type, ahead of the registry."""
+    convert = TransformData(
+        Table(
+            "demo",
+            MetaData(),
+            Column("code", String),
+            Column("count", Integer),
+            Column("text", String),
+        ),
+        {"code": str.upper, int: lambda s: int(s, 16)},
+    )
+
+    assert {"code": "AB", "count": 255, "text": "x"} == convert(
+        {"code": "ab", "count": "ff", "text": "x"}
+    )
+
+
+def test_extra_str_converter_keeps_length_check():
+    """A str converter by type still has String(length) enforced."""
+    convert = TransformData(
+        Table("demo", MetaData(), Column("msg", String(5))),
+        {str: str.strip},
+    )
+
+    assert {"msg": "hi"} == convert({"msg": " hi  "})
+    with pytest.raises(ValueError):
+        convert({"msg": "too long"})
+
+
+def test_extra_str_converter_length_after_convert():
+    """String(length) applies to the converted value, not the raw cell."""
+    convert = TransformData(
+        Table("demo", MetaData(), Column("msg", String(5))),
+        {str: str.strip},
+    )
+
+    assert {"msg": "abcde"} == convert({"msg": " abcde "})
+
+
+def test_extra_str_converter_unhashable():
+    """A str converter need not be hashable to have its length checked."""
+
+    @dataclasses.dataclass
+    class Strip:
+        def __call__(self, value):
+            return value.strip()
+
+    convert = TransformData(
+        Table("demo", MetaData(), Column("msg", String(5))),
+        {str: Strip()},
+    )
+
+    assert {"msg": "abcde"} == convert({"msg": " abcde "})
+    with pytest.raises(ValueError):
+        convert({"msg": "too long"})
+
+
+def test_factory_shares_converters():
+    """TransformData.factory applies the same extra converters to each table."""
+    make = TransformData.factory({int: lambda s: int(s, 16)})
+    first = make(Table("first", MetaData(), Column("a", Integer)))
+    second = make(Table("second", MetaData(), Column("b", Integer)))
+
+    assert isinstance(first, TransformData)
+    assert first.converters is second.converters
+    assert {"a": 16} == first({"a": "10"})
+    assert {"b": 255} == second({"b": "ff"})
+
+
+def test_from_columns_without_table():
+    """Columns need not belong to a Table, extra converters still apply."""
+    col = Column("count", Integer)
+    convert = TransformData.from_columns(
+        col, name="adhoc", extra_converters={int: lambda s: int(s, 16)}
+    )
+
+    assert "adhoc" == convert.name
+    assert col.table is None
+    assert {"count": 255} == convert({"count": "ff"})
+
+
 def test_enum_with_str():
     """Test str to enum.Enum with str member values."""
 
@@ -143,6 +283,25 @@ def test_enum_with_int():
         assert Level.INFO == create_enum_from_string(Level, "invalid")
 
 
+def test_enum_mixed_values_first_match():
+    """Mixed value kinds match the first member in definition order."""
+
+    class Number(enum.Enum):
+        A = 1.0
+        B = "1"
+
+    class Pair(enum.Enum):
+        A = ("x", "y")
+        B = "x"
+
+    assert Number.A == create_enum_from_string(Number, "1")
+    assert Pair.A == create_enum_from_string(Pair, "x")
+    assert Pair.B == create_enum_from_string(Pair, "b")
+
+    convert = transformer(Column("n", Enums(Number)), Column("p", Enums(Pair)))
+    assert {"n": Number.A, "p": Pair.A} == convert({"n": "1", "p": "x"})
+
+
 def test_enum_flag():
     """Test str to enum.IntFlag with member values and comma seperated values."""
     assert Permissions.READ == create_flag_from_string(Permissions, "1")
@@ -151,12 +310,23 @@ def test_enum_flag():
     assert Permissions.ADMIN == create_flag_from_string(
         Permissions, "read|write|execute "
     )
+    assert Permissions.READ | Permissions.WRITE == create_flag_from_string(
+        Permissions, "read, write"
+    )
     with pytest.raises(ValueError):
         create_enum_from_string(Permissions, "101038")
     with pytest.raises(ValueError):
         create_enum_from_string(Permissions, "read|invalid")
 
 
+def test_enum_flag_unknown_name_warns():
+    """Unknown flag names are skipped with a warning."""
+    # Warned once per process; forget earlier calls so this test still warns.
+    _warn_unknown_flag.cache_clear()
+    with pytest.warns(UserWarning, match="'DELETE' not found in Permissions"):
+        assert Permissions.READ == create_flag_from_string(Permissions, "read|delete")
+
+
 def test_multi_enum_convert():
     transformer = TransformData(inspect(MultiEnum).local_table)
     data = transformer(
@@ -177,6 +347,29 @@ def test_multi_enum_convert():
     }
 
 
+def test_enum_column_lookup():
+    """Enum columns match by name, value or fall back to a member scan."""
+
+    class Mode(enum.IntEnum):
+        OFF = 0
+        ON = 1
+
+    convert = transformer(
+        Column("mode", Enums(Mode)),
+        Column("state", Enums(State)),
+    )
+
+    assert {"mode": Mode.OFF, "state": State.ACTIVE} == convert(
+        {"mode": "off", "state": "Active"}
+    )
+    assert {"mode": Mode.OFF, "state": State.PENDING} == convert(
+        {"mode": "0", "state": "PENDING"}
+    )
+    assert Mode.ON == convert({"mode": " 1"})["mode"]
+    with pytest.raises(ValueError):
+        convert({"mode": "2"})
+
+
 def test_enum_type_detect():
     assert True == is_int_enum(Level)  # noqa 712
     assert False == is_int_enum(State)  # noqa 712